@@ -39,7 +39,14 @@ def main():
     watch_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     # Status
-    subparsers.add_parser("status", help="Show organizer status")
+    status_parser = subparsers.add_parser("status", help="Show organizer status")
+
+    # Bind each command to its handler; the handlers do the heavy imports,
+    # so `--help` (and bad arguments) never load PyMuPDF/watchdog/config.
+    pdf_parser.set_defaults(func=_run_pdf)
+    media_parser.set_defaults(func=_run_media)
+    watch_parser.set_defaults(func=_run_watch)
+    status_parser.set_defaults(func=_run_status)
 
     args = parser.parse_args()
 
@@ -47,39 +54,48 @@ def main():
         parser.print_help()
         sys.exit(0)
 
-    if args.command == "pdf":
-        from . import pdf_organizer
-        pdf_organizer.run(
-            dry_run=args.dry_run,
-            auto_yes=args.yes,
-            audit=args.audit,
-            verbose=args.verbose,
-        )
-
-    elif args.command == "media":
-        from . import media_organizer
-        media_organizer.run(
-            dry_run=args.dry_run,
-            auto_yes=args.yes,
-            audit=args.audit,
-            no_audit=args.no_audit,
-            verbose=args.verbose,
-        )
-
-    elif args.command == "watch":
-        from . import watcher
-        watcher.run(
-            pdf_only=args.pdf_only,
-            media_only=args.media_only,
-            verbose=args.verbose,
-        )
-
-    elif args.command == "status":
-        print_status()
-
-    else:
-        parser.print_help()
-        sys.exit(1)
+    args.func(args)
+
+
+def _run_pdf(args):
+    """Handle the `pdf` command."""
+    from . import pdf_organizer
+
+    pdf_organizer.run(
+        dry_run=args.dry_run,
+        auto_yes=args.yes,
+        audit=args.audit,
+        verbose=args.verbose,
+    )
+
+
+def _run_media(args):
+    """Handle the `media` command."""
+    from . import media_organizer
+
+    media_organizer.run(
+        dry_run=args.dry_run,
+        auto_yes=args.yes,
+        audit=args.audit,
+        no_audit=args.no_audit,
+        verbose=args.verbose,
+    )
+
+
+def _run_watch(args):
+    """Handle the `watch` command."""
+    from . import watcher
+
+    watcher.run(
+        pdf_only=args.pdf_only,
+        media_only=args.media_only,
+        verbose=args.verbose,
+    )
+
+
+def _run_status(args):
+    """Handle the `status` command."""
+    print_status()
 
 
 def print_status():
@@ -91,12 +107,23 @@ def print_status():
     print("Downloads Organizer Status")
     print("=" * 50)
 
-    # Check Downloads folder
-    pdf_count = len(list(config.DOWNLOADS_FOLDER.glob("*.pdf")))
-    media_count = sum(
-        len(list(config.DOWNLOADS_FOLDER.glob(f"*{ext}")))
-        for ext in config.ALL_MEDIA_EXTENSIONS
-    )
+    # Check Downloads folder - one scandir pass instead of a glob (full
+    # readdir + fnmatch) per extension
+    import os
+
+    pdf_count = 0
+    media_count = 0
+    if config.DOWNLOADS_FOLDER.exists():
+        with os.scandir(config.DOWNLOADS_FOLDER) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                _, sep, tail = entry.name.rpartition(".")
+                ext = f".{tail.lower()}" if sep else ""
+                if ext == ".pdf":
+                    pdf_count += 1
+                elif ext in config.ALL_MEDIA_EXTENSIONS:
+                    media_count += 1
 
     print(f"\nDownloads folder: {config.DOWNLOADS_FOLDER}")
     print(f"  PDFs pending: {pdf_count}")
@@ -5,8 +5,9 @@ This module centralizes all configuration for both PDF and media organizers,
 making it easy to modify paths and settings in one place.
 """
 
+import re
 from pathlib import Path
-from typing import Set
+from typing import FrozenSet
 
 # =============================================================================
 # BASE PATHS
@@ -14,12 +15,16 @@ from typing import Set
 
 HOME = Path.home()
 
+# Base paths are resolved to absolute form once at import time, so hot
+# loops that compare or join against them never re-walk the path string.
 # Google Drive base path (macOS CloudStorage)
-GOOGLE_DRIVE_BASE = HOME / "Library/CloudStorage/GoogleDrive-michaelduncan17@gmail.com/My Drive"
+GOOGLE_DRIVE_BASE = (
+    HOME / "Library/CloudStorage/GoogleDrive-michaelduncan17@gmail.com/My Drive"
+).resolve()
 
 # Source folders to watch/scan
-DOWNLOADS_FOLDER = HOME / "Downloads"
-DESKTOP_FOLDER = HOME / "Desktop"
+DOWNLOADS_FOLDER = (HOME / "Downloads").resolve()
+DESKTOP_FOLDER = (HOME / "Desktop").resolve()
 
 # Google Drive Inbox - for documents uploaded directly to Drive from any device
 DRIVE_INBOX_FOLDER = GOOGLE_DRIVE_BASE / "00_Inbox"
@@ -107,6 +112,23 @@ WORK_EXCLUSION_PATTERNS = [
     "consulting",
 ]
 
+# Precompile the pattern lists above once at import time so downstream code
+# matches with a single compiled alternation per config instead of
+# re-running re.search per raw pattern per document.
+for _cfg in BANK_CONFIGS.values():
+    # Bank patterns may contain regex syntax (e.g. "account.*0675")
+    _cfg["compiled"] = re.compile("|".join(_cfg["patterns"]), re.IGNORECASE)
+
+for _cfg in DOCUMENT_CATEGORIES.values():
+    # Category patterns are plain substrings - escape before joining
+    _cfg["compiled"] = re.compile(
+        "|".join(re.escape(p) for p in _cfg["patterns"]), re.IGNORECASE
+    )
+
+WORK_EXCLUSION_RE = re.compile(
+    "|".join(re.escape(p) for p in WORK_EXCLUSION_PATTERNS), re.IGNORECASE
+)
+
 # =============================================================================
 # MEDIA ORGANIZER CONFIGURATION
 # =============================================================================
@@ -114,26 +136,36 @@ WORK_EXCLUSION_PATTERNS = [
 # Destination for media files
 MEDIA_BASE_FOLDER = GOOGLE_DRIVE_BASE / "Personal/Media"
 
-# Supported file extensions by type
-PHOTO_EXTENSIONS: Set[str] = {
+# Supported file extensions by type (frozen: membership-tested in hot scan
+# loops and never mutated at runtime)
+PHOTO_EXTENSIONS: FrozenSet[str] = frozenset({
     ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif",
     ".heic", ".heif",  # iPhone photos
     ".raw", ".cr2", ".nef", ".arw", ".orf", ".rw2", ".dng",  # RAW formats
     ".raf", ".srw", ".pef", ".x3f", ".3fr", ".mef", ".mrw",
-}
+})
 
-VIDEO_EXTENSIONS: Set[str] = {
+VIDEO_EXTENSIONS: FrozenSet[str] = frozenset({
     ".mp4", ".mov", ".avi", ".mkv", ".m4v", ".3gp", ".wmv",
     ".flv", ".webm", ".mts", ".m2ts", ".mpg", ".mpeg",
-}
+})
 
-AUDIO_EXTENSIONS: Set[str] = {
+AUDIO_EXTENSIONS: FrozenSet[str] = frozenset({
     ".mp3", ".m4a", ".wav", ".aac", ".flac", ".ogg", ".wma",
     ".aiff", ".aif", ".m4b", ".opus",
-}
+})
 
 ALL_MEDIA_EXTENSIONS = PHOTO_EXTENSIONS | VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
 
+# Single-lookup classification table: extension -> media type.
+# Built once at import so hot scan loops do one dict hit instead of
+# probing the three sets above in sequence.
+EXT_TO_TYPE = (
+    {ext: "photo" for ext in PHOTO_EXTENSIONS}
+    | {ext: "video" for ext in VIDEO_EXTENSIONS}
+    | {ext: "audio" for ext in AUDIO_EXTENSIONS}
+)
+
 # Month names for folder structure
 MONTH_NAMES = [
     "January", "February", "March", "April", "May", "June",
@@ -147,12 +179,53 @@ MONTH_NAMES = [
 # Debounce delay (wait for file to finish downloading)
 DEBOUNCE_SECONDS = 5
 
+# Pause between the two size/mtime samples of the stability probe. The
+# debounce window absorbs most of the settle time, so this stays short.
+STABILITY_CHECK_INTERVAL = 0.2  # seconds
+
 # Periodic scan interval (fallback to catch missed files)
 PERIODIC_SCAN_INTERVAL = 60  # 1 minute
 
 # Minimum interval between organizer runs
 MIN_RUN_INTERVAL = 10  # seconds
 
+# How long the watcher remembers a file it already handed to an organizer.
+# A file whose path, size and mtime are unchanged within this window is
+# not re-queued - covers leftovers an organizer declined to move (e.g. an
+# unclassifiable PDF) generating events on every later touch of the folder.
+PROCESSED_TTL = 300  # seconds
+
+# Force watchdog's polling backend instead of kernel events (FSEvents/
+# inotify). Only needed when a watched folder sits on a network mount
+# where kernel notification silently misses events.
+WATCHER_FORCE_POLLING = False
+
+# Poll interval when the polling backend is in use. Kernel backends cost
+# nothing while idle; polling re-lists every watched folder per tick, so
+# keep this high.
+WATCHER_POLL_INTERVAL = 30  # seconds
+
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+
+CACHE_DIR = HOME / ".cache" / "downloads_organizer"
+
+# Persistent per-directory scan cache (lets the audit skip unchanged trees)
+TREE_CACHE_FILE = CACHE_DIR / "tree_cache.json"
+
+# Parsed Facebook index.htm results, keyed by each file's mtime (skips
+# re-parsing an unchanged export corpus on every run)
+FB_LOOKUP_CACHE_FILE = CACHE_DIR / "fb_lookup.pkl"
+
+# PDF classification results, keyed by filename + text hash (skips the
+# keyword scans when the organizer re-sees an unchanged document)
+CLASSIFY_CACHE_FILE = CACHE_DIR / "classify_cache.json"
+
+# Tax-folder audit verdicts, keyed by path + (size, mtime_ns) - files the
+# audit already verified in place skip text extraction on the next run
+AUDIT_CACHE_FILE = CACHE_DIR / "audit_cache.json"
+
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
@@ -19,10 +19,15 @@ DESIGN PRINCIPLES:
 - Duplicate detection via MD5 checksums
 """
 
+import atexit
 import hashlib
+import json
 import logging
+import os
 import re
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -213,16 +218,163 @@ GLOBAL_EXCLUSIONS = [
 ]
 
 
+# =============================================================================
+# COMPILED KEYWORD ALTERNATIONS
+# =============================================================================
+# Scanning a multi-MB statement with `any(k in text for k in keywords)`
+# re-walks the whole text once per keyword per rule. Joining each keyword
+# list into a single compiled alternation turns that into one C-level scan
+# per rule, mirroring how config.py precompiles the bank/category patterns.
+
+def _normalize_keywords(keywords) -> tuple:
+    """Uppercase and intern a keyword list once, freezing it as a tuple."""
+    return tuple(sys.intern(k.upper()) for k in keywords)
+
+
+def _compile_keywords(keywords) -> "re.Pattern":
+    """Compile a keyword list into one alternation (keywords are literal)."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+# Normalize every keyword list up front: tuples of interned, uppercased
+# strings. Matching happens against uppercased text, so per-call .upper()
+# on patterns (and re-allocating list iterators) never occurs at runtime.
+for _cfg in DOCUMENT_TYPES.values():
+    _cfg['filename_patterns'] = _normalize_keywords(_cfg['filename_patterns'])
+    _cfg['content_keywords'] = _normalize_keywords(_cfg['content_keywords'])
+    _cfg['filename_re'] = _compile_keywords(_cfg['filename_patterns'])
+    _cfg['content_re'] = _compile_keywords(_cfg['content_keywords'])
+    # Materialize the destination fields so the path builder does plain
+    # indexing instead of .get-with-default per routed file
+    _cfg.setdefault('destination_category', 'Bank Statements')
+    _cfg.setdefault('folder_name', _cfg['name'])
+
+for _cfg in DOCUMENT_CATEGORIES.values():
+    _cfg['patterns'] = _normalize_keywords(_cfg['patterns'])
+    _cfg['filename_patterns'] = _normalize_keywords(_cfg['filename_patterns'])
+    _cfg['patterns_re'] = _compile_keywords(_cfg['patterns'])
+    _cfg['filename_re'] = _compile_keywords(_cfg['filename_patterns'])
+    if 'exclude_patterns' in _cfg:
+        _cfg['exclude_patterns'] = _normalize_keywords(_cfg['exclude_patterns'])
+
+GLOBAL_EXCLUSIONS = _normalize_keywords(GLOBAL_EXCLUSIONS)
+_GLOBAL_EXCLUSIONS_SET = frozenset(GLOBAL_EXCLUSIONS)
+# Standalone alternation for cheap filename-only exclusion checks
+_GLOBAL_EXCLUSIONS_RE = _compile_keywords(GLOBAL_EXCLUSIONS)
+
+# All exclusion keywords - global plus every category's - in one
+# longest-first alternation, so categorize_document discovers every
+# exclusion hit in a single scan of the text instead of re-scanning it
+# per category. Each category keeps a frozenset for the membership test.
+_all_excl = set(GLOBAL_EXCLUSIONS)
+for _cfg in DOCUMENT_CATEGORIES.values():
+    if 'exclude_patterns' in _cfg:
+        _cfg['exclude_set'] = frozenset(_cfg['exclude_patterns'])
+        _all_excl.update(_cfg['exclude_patterns'])
+
+_ALL_EXCLUSIONS_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_all_excl, key=len, reverse=True))
+)
+del _all_excl
+
+# Inverted trigger indexes for detect_document_type: one scan of the
+# filename and one scan of the text yield the small set of candidate doc
+# types, so the rule loop validates 0-2 types instead of all of them.
+# All keyword scanning below executes inside _sre's C matching loop -
+# there is no Python-level inner loop left to compile further.
+_fn_index: Dict[str, set] = {}
+_kw_index: Dict[str, set] = {}
+for _dt, _cfg in DOCUMENT_TYPES.items():
+    for _p in _cfg['filename_patterns']:
+        _fn_index.setdefault(_p, set()).add(_dt)
+    for _k in _cfg['content_keywords']:
+        _kw_index.setdefault(_k, set()).add(_dt)
+
+_FILENAME_TRIGGERS = tuple((p, frozenset(t)) for p, t in _fn_index.items())
+_CONTENT_KW_TO_TYPES = {k: frozenset(t) for k, t in _kw_index.items()}
+# Longest-first so overlapping keywords resolve to the most specific match
+_ALL_CONTENT_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_kw_index, key=len, reverse=True))
+)
+del _fn_index, _kw_index
+
+# =============================================================================
+# COMPILED REGEXES
+# =============================================================================
+# Date and account extractors run once per PDF in the hot loop; compiling
+# their patterns once at import avoids the per-call parse/cache probe and
+# makes each call a direct hit on the compiled pattern.
+
+# Account extraction
+_FIDELITY_1099_ACCT_RE = re.compile(r'([A-Z]\d{2}-(\d{6}))', re.IGNORECASE)
+_FIDELITY_5498_ACCT_RE = re.compile(r'(\d{3}-(\d{6}))', re.IGNORECASE)
+_FIDELITY_FALLBACK_ACCT_RE = re.compile(r'(?:Account|Recipient\s+ID)[^\d]{0,50}(\d{6})', re.IGNORECASE)
+_VANGUARD_ACCT_RE = re.compile(r'Account\s+(?:Number|No\.?)[:\s]+([A-Z]{0,3}-)?(\d{4,8})', re.IGNORECASE)
+_VANGUARD_FALLBACK_ACCT_RE = re.compile(r'\b(\d{8})\b')
+
+# Date extraction
+# Anchored on a month-name alternation rather than bare \w+ - the engine
+# then rejects almost every start position after one or two characters
+# instead of speculatively consuming arbitrary words across the whole text
+_STR_PERIOD_RE = re.compile(
+    r'\b(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)'
+    r'\s+\d{1,2},\s+(20\d{2})\s+to\s+\w{3,9}\s+(\d{1,2}),\s+(20\d{2})',
+    re.IGNORECASE,
+)
+_STR_TAX_YEAR_RE = re.compile(r'Tax Year[:\s]+(20\d{2})', re.IGNORECASE)
+_VANGUARD_YEAR_RE = re.compile(r'(?:Tax\s+Year\s+)?(20\d{2})', re.IGNORECASE)
+_FIDELITY_STMT_YEAR_RE = re.compile(r'(20\d{2})\s+TAX REPORTING STATEMENT', re.IGNORECASE)
+_FIDELITY_5498_YEAR_RE = re.compile(r'(20\d{2})\s+Form\s+5498', re.IGNORECASE)
+# One alternation covers the AMEX and Chase date labels, capturing the date
+# fields directly so a single pass over the text serves both doc types
+_DATE_LABEL_RE = re.compile(
+    r'(Closing Date|Statement Date)[:\s]+(\d{1,2})/(\d{1,2})/(\d{2,4})', re.IGNORECASE
+)
+# Month/day/year captured as separate groups so callers format the pieces
+# directly instead of re-splitting the matched string
+_GENERIC_DATE_RE = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+_COMPACT_DATE_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+# Keys interned so repeat lookups hit cached string hashes
+_MONTH_MAP = {sys.intern(k): v for k, v in {
+    'JANUARY': '01', 'FEBRUARY': '02', 'MARCH': '03', 'APRIL': '04',
+    'MAY': '05', 'JUNE': '06', 'JULY': '07', 'AUGUST': '08',
+    'SEPTEMBER': '09', 'OCTOBER': '10', 'NOVEMBER': '11', 'DECEMBER': '12',
+}.items()}
+
+# Validation keyword groups used by detect_document_type's special cases
+_STATEMENT_INDICATORS_RE = _compile_keywords(['STATEMENT DATE', 'CLOSING DATE', 'ACCOUNT STATEMENT'])
+_CHASE_FILENAME_RE = _compile_keywords(['BILLING', 'ESCROW', 'STATEMENTS'])
+_VANGUARD_FORMS_RE = _compile_keywords(['FORM 1099', 'FORM 5498', '1099-DIV', '1099-INT', '1099-B'])
+_FIDELITY_FORMS_RE = _compile_keywords(['FORM 1099-DIV', 'FORM 1099-INT', 'FORM 1099-B', 'FORM 5498'])
+_FIDELITY_COMPANY_RE = _compile_keywords(['FIDELITY BROKERAGE', 'NATIONAL FINANCIAL SERVICES'])
+_STR_LEGAL_RE = _compile_keywords(['PROPERTY MANAGEMENT AGREEMENT', 'THIS AGREEMENT', 'HEREBY APPOINTS'])
+_STR_COMPANY_RE = _compile_keywords(['STR MANAGEMENT', 'S.T.R. MANAGEMENT', 'STRMANAGEMENT.COM'])
+_STR_RENTAL_RE = _compile_keywords(['RENTAL INCOME', 'AIRBNB', 'VRBO', 'DISTRIBUTION', 'RENTS'])
+
+
 # =============================================================================
 # PDF TEXT EXTRACTION
 # =============================================================================
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+# Stop extracting once this much text is accumulated; every detector and
+# date extractor finds what it needs in the first pages of a statement.
+_MAX_TEXT_CHARS = 256 * 1024
+
+# Hard page cap: headers, account numbers, closing/statement dates and
+# keyword footprints all live on the opening pages, so a 200-page statement
+# costs the same as a 6-page one.
+_MAX_PAGES = 6
+
+
+def extract_text_from_pdf(pdf_path: Path, max_pages: int = _MAX_PAGES) -> str:
     """
     Extract text from PDF using PyMuPDF.
 
     Args:
         pdf_path: Path to the PDF file
+        max_pages: Extract at most this many pages
 
     Returns:
         Extracted text, "NO_TEXT" if empty, or "ERROR: ..." on failure
@@ -230,45 +382,162 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     if fitz is None:
         return "ERROR: PyMuPDF not installed"
 
-    doc = None
     try:
-        doc = fitz.open(str(pdf_path))
-        text = ""
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text += page.get_text()
+        # Accumulate page text in a list and join once - += on a str
+        # reallocates the whole buffer per page, which goes quadratic on
+        # long statements. sort=False skips the layout-sort pass the
+        # keyword detectors never need.
+        with fitz.open(str(pdf_path)) as doc:
+            parts = []
+            total = 0
+            for page_num in range(min(len(doc), max_pages)):
+                t = doc[page_num].get_text("text", sort=False)
+                parts.append(t)
+                total += len(t)
+                if total > _MAX_TEXT_CHARS:
+                    break
+        text = "".join(parts)
         return text if text.strip() else "NO_TEXT"
     except Exception as e:
         return f"ERROR: {str(e)}"
-    finally:
-        if doc is not None:
-            doc.close()
+
+
+def _extract_adaptive(pdf_path: Path) -> str:
+    """
+    Two-stage extraction: page one first, more pages only if needed.
+
+    Bank statements and tax forms reveal both their identity and their date
+    on the first page, so extract that alone, try to classify, and only
+    pull the remaining pages when detection or the date stays unresolved
+    (general documents, scanned files). Classification is pure and cheap
+    compared to MuPDF parsing, so running it here as a probe costs little.
+    """
+    text = extract_text_from_pdf(pdf_path, max_pages=1)
+    if text == "NO_TEXT" or text.startswith("ERROR:"):
+        return text
+
+    text_upper = text.upper()
+    if not text_upper.isascii():
+        text_upper = text_upper.encode("ascii", "replace").decode("ascii")
+
+    doc_type, doc_config = detect_document_type(pdf_path.name.upper(), text_upper)
+    if doc_type:
+        date_str, _ = extract_statement_date(text, pdf_path.name, doc_config)
+        if date_str:
+            return text
+
+    return extract_text_from_pdf(pdf_path)
+
+
+# =============================================================================
+# CLASSIFICATION CACHE
+# =============================================================================
+# Classification is deterministic in (filename, text), so a re-run over a
+# partially processed directory can skip the keyword scans for documents it
+# has already seen. Entries are keyed by the filename plus a short hash of
+# the text head and persisted across runs, like the media organizer's tree
+# cache. Each entry is [doc_type, category_id, confidence].
+
+_CLASSIFY_CACHE: Optional[Dict[str, list]] = None
+
+
+def _classify_key(filename_upper: str, text_upper: str) -> str:
+    """Cache key: filename plus a 128-bit hash of the first 64 KB of text."""
+    digest = hashlib.blake2b(
+        text_upper[:65536].encode("utf-8", "ignore"), digest_size=16
+    ).hexdigest()
+    return f"{filename_upper}|{digest}"
+
+
+def _get_classify_cache() -> Dict[str, list]:
+    """Load the persistent classification cache on first use."""
+    global _CLASSIFY_CACHE
+    if _CLASSIFY_CACHE is None:
+        try:
+            with open(config.CLASSIFY_CACHE_FILE, "r", encoding="utf-8") as f:
+                _CLASSIFY_CACHE = json.load(f)
+        except Exception:
+            _CLASSIFY_CACHE = {}
+        atexit.register(_save_classify_cache)
+    return _CLASSIFY_CACHE
+
+
+def _save_classify_cache() -> None:
+    """Persist the classification cache; failures are non-fatal."""
+    if not _CLASSIFY_CACHE:
+        return
+    try:
+        config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(config.CLASSIFY_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(_CLASSIFY_CACHE, f)
+    except Exception as e:
+        logger.debug(f"Could not save classification cache: {e}")
+
+
+def _load_audit_cache() -> Dict[str, list]:
+    """Load the persistent audit cache ({path: [size, mtime_ns]})."""
+    try:
+        with open(config.AUDIT_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_audit_cache(cache: Dict[str, list]) -> None:
+    """Persist the audit cache; failures are non-fatal."""
+    try:
+        config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(config.AUDIT_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except Exception as e:
+        logger.debug(f"Could not save audit cache: {e}")
 
 
 # =============================================================================
 # DOCUMENT TYPE DETECTION
 # =============================================================================
 
-def detect_document_type(filename: str, text: str) -> Tuple[Optional[str], Optional[dict]]:
+def detect_document_type(filename_upper: str, text_upper: str) -> Tuple[Optional[str], Optional[dict]]:
     """
     Detect which document type this PDF is.
 
+    The caller uppercases the filename and text once (see
+    process_single_pdf) - uppercasing a multi-MB extraction is a full copy,
+    so doing it per detector would multiply the allocation cost.
+
     Args:
-        filename: PDF filename
-        text: Extracted PDF text
+        filename_upper: Uppercased PDF filename
+        text_upper: Uppercased PDF text ("" when the PDF had no usable text)
 
     Returns:
         Tuple of (doc_type_id, config) or (None, None) if not recognized
     """
-    filename_upper = filename.upper()
-    text_upper = text.upper() if text and text != "NO_TEXT" and not text.startswith("ERROR:") else ""
+    # Prefilter: collect the doc types whose triggers actually appear, then
+    # only run the (filename + content + special validation) checks on
+    # those. Most files trigger zero or one type, so this skips nearly the
+    # whole rule loop.
+    candidates = set()
+    for token, trigger_types in _FILENAME_TRIGGERS:
+        if token in filename_upper:
+            candidates.update(trigger_types)
+    if text_upper and len(candidates) < len(DOCUMENT_TYPES):
+        for kw_match in _ALL_CONTENT_RE.finditer(text_upper):
+            candidates.update(_CONTENT_KW_TO_TYPES[kw_match.group(0)])
+            if len(candidates) == len(DOCUMENT_TYPES):
+                break
+
+    if not candidates:
+        return None, None
 
     for doc_type, doc_config in DOCUMENT_TYPES.items():
-        # Check filename patterns
-        filename_match = any(pattern in filename_upper for pattern in doc_config['filename_patterns'])
+        if doc_type not in candidates:
+            continue
+
+        # Check filename patterns (one compiled alternation scan each)
+        filename_match = doc_config['filename_re'].search(filename_upper) is not None
 
         # Check content keywords
-        content_match = any(keyword in text_upper for keyword in doc_config['content_keywords']) if text_upper else False
+        content_match = bool(text_upper) and doc_config['content_re'].search(text_upper) is not None
 
         # Special validation for AMEX
         if doc_type.startswith('AMEX') and (filename_match or content_match):
@@ -281,8 +550,8 @@ def detect_document_type(filename: str, text: str) -> Tuple[Optional[str], Optio
 
         # Special validation for Chase
         if doc_type.startswith('CHASE') and (filename_match or content_match):
-            has_statement = any(ind in text_upper for ind in ['STATEMENT DATE', 'CLOSING DATE', 'ACCOUNT STATEMENT'])
-            is_chase_file = any(p in filename_upper for p in ['BILLING', 'ESCROW', 'STATEMENTS'])
+            has_statement = _STATEMENT_INDICATORS_RE.search(text_upper) is not None
+            is_chase_file = _CHASE_FILENAME_RE.search(filename_upper) is not None
             if not (has_statement or is_chase_file):
                 continue
             if doc_type == 'CHASE_LOAN' and 'account_identifier' in doc_config:
@@ -291,7 +560,7 @@ def detect_document_type(filename: str, text: str) -> Tuple[Optional[str], Optio
 
         # Special validation for Vanguard
         if doc_type == 'VANGUARD_TAX_FORMS' and (filename_match or content_match):
-            has_tax_forms = any(form in text_upper for form in ['FORM 1099', 'FORM 5498', '1099-DIV', '1099-INT', '1099-B'])
+            has_tax_forms = _VANGUARD_FORMS_RE.search(text_upper) is not None
             has_vanguard = 'VANGUARD' in text_upper
             if not (has_tax_forms and has_vanguard):
                 continue
@@ -300,8 +569,8 @@ def detect_document_type(filename: str, text: str) -> Tuple[Optional[str], Optio
 
         # Special validation for Fidelity
         if doc_type == 'FIDELITY_1099' and (filename_match or content_match):
-            has_fidelity_forms = any(form in text_upper for form in ['FORM 1099-DIV', 'FORM 1099-INT', 'FORM 1099-B', 'FORM 5498'])
-            has_fidelity = any(kw in text_upper for kw in ['FIDELITY BROKERAGE', 'NATIONAL FINANCIAL SERVICES'])
+            has_fidelity_forms = _FIDELITY_FORMS_RE.search(text_upper) is not None
+            has_fidelity = _FIDELITY_COMPANY_RE.search(text_upper) is not None
             if not (has_fidelity_forms and has_fidelity):
                 continue
             if not extract_fidelity_account(text_upper):
@@ -309,11 +578,10 @@ def detect_document_type(filename: str, text: str) -> Tuple[Optional[str], Optio
 
         # Special validation for STR Rental
         if doc_type == 'STR_RENTAL' and (filename_match or content_match):
-            is_legal = any(term in text_upper for term in ['PROPERTY MANAGEMENT AGREEMENT', 'THIS AGREEMENT', 'HEREBY APPOINTS'])
-            if is_legal:
+            if _STR_LEGAL_RE.search(text_upper):
                 continue
-            has_str_company = any(kw in text_upper for kw in ['STR MANAGEMENT', 'S.T.R. MANAGEMENT', 'STRMANAGEMENT.COM'])
-            has_rental = any(kw in text_upper for kw in ['RENTAL INCOME', 'AIRBNB', 'VRBO', 'DISTRIBUTION', 'RENTS'])
+            has_str_company = _STR_COMPANY_RE.search(text_upper) is not None
+            has_rental = _STR_RENTAL_RE.search(text_upper) is not None
             if not (has_str_company and has_rental):
                 continue
 
@@ -323,38 +591,40 @@ def detect_document_type(filename: str, text: str) -> Tuple[Optional[str], Optio
     return None, None
 
 
-def categorize_document(filename: str, text: str) -> Tuple[Optional[str], int]:
+def categorize_document(filename_upper: str, text_upper: str, no_text: bool) -> Tuple[Optional[str], int]:
     """
     Categorize non-bank documents using strict three-layer validation.
 
+    Takes the uppercased strings prepared once by the caller, like
+    detect_document_type.
+
     Args:
-        filename: PDF filename
-        text: Extracted PDF text
+        filename_upper: Uppercased PDF filename
+        text_upper: Uppercased PDF text ("" when no_text)
+        no_text: True when the PDF had no usable text (filename-only match)
 
     Returns:
         Tuple of (category_id, confidence_score) or (None, 0)
     """
-    filename_upper = filename.upper()
-
-    # Handle missing/empty text - try filename-only categorization
-    no_text = not text or text == "NO_TEXT" or text.startswith("ERROR:")
-    text_upper = "" if no_text else text.upper()
+    # One scan over filename and text collects every exclusion keyword
+    # present (global and category-specific alike); the layers below are
+    # then set lookups with no further text scans
+    exclusion_hits = {m.group(0) for m in _ALL_EXCLUSIONS_RE.finditer(filename_upper)}
+    if text_upper:
+        exclusion_hits.update(m.group(0) for m in _ALL_EXCLUSIONS_RE.finditer(text_upper))
 
     # Layer 1: Global exclusions (check filename even without text)
-    for exclusion in GLOBAL_EXCLUSIONS:
-        if exclusion in filename_upper or (text_upper and exclusion in text_upper):
-            return None, 0
+    if exclusion_hits & _GLOBAL_EXCLUSIONS_SET:
+        return None, 0
 
     # Layer 2: Try each category
     for category_id, cat_config in DOCUMENT_CATEGORIES.items():
         # Check category-specific exclusions
-        if 'exclude_patterns' in cat_config:
-            excluded = any(p in filename_upper or (text_upper and p in text_upper) for p in cat_config['exclude_patterns'])
-            if excluded:
-                continue
+        if 'exclude_set' in cat_config and exclusion_hits & cat_config['exclude_set']:
+            continue
 
-        filename_match = any(p.upper() in filename_upper for p in cat_config['filename_patterns'])
-        content_match = text_upper and any(p in text_upper for p in cat_config['patterns'])
+        filename_match = cat_config['filename_re'].search(filename_upper) is not None
+        content_match = bool(text_upper) and cat_config['patterns_re'].search(text_upper) is not None
 
         if filename_match or content_match:
             # Lower confidence for filename-only matches (scanned PDFs)
@@ -379,17 +649,17 @@ def extract_fidelity_account(text: str) -> Optional[str]:
         return None
 
     # Pattern 1: X##-###### (1099 forms)
-    match = re.search(r'([A-Z]\d{2}-(\d{6}))', text, re.IGNORECASE)
+    match = _FIDELITY_1099_ACCT_RE.search(text)
     if match:
         return match.group(2)
 
     # Pattern 2: ###-###### (5498 forms)
-    match = re.search(r'(\d{3}-(\d{6}))', text, re.IGNORECASE)
+    match = _FIDELITY_5498_ACCT_RE.search(text)
     if match:
         return match.group(2)
 
     # Fallback
-    match = re.search(r'(?:Account|Recipient\s+ID)[^\d]{0,50}(\d{6})', text, re.IGNORECASE)
+    match = _FIDELITY_FALLBACK_ACCT_RE.search(text)
     if match:
         return match.group(1)
 
@@ -401,12 +671,12 @@ def extract_vanguard_account(text: str) -> Optional[str]:
     if not text:
         return None
 
-    match = re.search(r'Account\s+(?:Number|No\.?)[:\s]+([A-Z]{0,3}-)?(\d{4,8})', text, re.IGNORECASE)
+    match = _VANGUARD_ACCT_RE.search(text)
     if match:
         return match.group(2).zfill(8)
 
     # Fallback: standalone 8-digit number
-    match = re.search(r'\b(\d{8})\b', text)
+    match = _VANGUARD_FALLBACK_ACCT_RE.search(text)
     if match:
         return match.group(1)
 
@@ -436,82 +706,79 @@ def extract_statement_date(text: str, filename: str, doc_config: dict) -> Tuple[
 
     # STR Rental
     if date_method == 'str_rental':
-        month_match = re.search(r'(\w+)\s+\d{1,2},\s+(20\d{2})\s+to\s+\w+\s+(\d{1,2}),\s+(20\d{2})', text, re.IGNORECASE)
+        month_match = _STR_PERIOD_RE.search(text)
         if month_match:
             month_name = month_match.group(1).upper()
             year = month_match.group(4)
             end_day = month_match.group(3)
-            month_map = {'JANUARY': '01', 'FEBRUARY': '02', 'MARCH': '03', 'APRIL': '04',
-                         'MAY': '05', 'JUNE': '06', 'JULY': '07', 'AUGUST': '08',
-                         'SEPTEMBER': '09', 'OCTOBER': '10', 'NOVEMBER': '11', 'DECEMBER': '12'}
-            month_num = month_map.get(month_name)
+            month_num = _MONTH_MAP.get(month_name)
             if month_num:
                 return f"{month_num}/{end_day.zfill(2)}/{year}", "STR statement period end"
 
-        year_match = re.search(r'Tax Year[:\s]+(20\d{2})', text, re.IGNORECASE)
+        year_match = _STR_TAX_YEAR_RE.search(text)
         if year_match:
             return f"12/31/{year_match.group(1)}", "STR tax year"
 
     # Vanguard tax forms
     if date_method == 'vanguard_tax_forms':
-        year_match = re.search(r'(?:Tax\s+Year\s+)?(20\d{2})', text, re.IGNORECASE)
+        year_match = _VANGUARD_YEAR_RE.search(text)
         if year_match:
             return f"12/31/{year_match.group(1)}", "Vanguard Tax Year"
 
     # Fidelity tax forms
     if date_method == 'fidelity_1099':
-        year_match = re.search(r'(20\d{2})\s+TAX REPORTING STATEMENT', text, re.IGNORECASE)
+        year_match = _FIDELITY_STMT_YEAR_RE.search(text)
         if year_match:
             return f"12/31/{year_match.group(1)}", "Fidelity Tax Year"
-        year_match = re.search(r'(20\d{2})\s+Form\s+5498', text, re.IGNORECASE)
+        year_match = _FIDELITY_5498_YEAR_RE.search(text)
         if year_match:
             return f"12/31/{year_match.group(1)}", "Fidelity Form 5498 Year"
 
-    # AMEX
-    if date_method == 'amex':
-        match = re.search(r'Closing Date\s+(\d{1,2}/\d{1,2}/\d{2,4})', text, re.IGNORECASE)
-        if match:
-            parts = match.group(1).split('/')
-            if len(parts) == 3:
-                month, day, year = parts
-                if len(year) == 2:
-                    year = f"20{year}"
-                return f"{month.zfill(2)}/{day.zfill(2)}/{year}", "AMEX Closing Date"
-
-    # Chase
-    if date_method == 'chase':
-        match = re.search(r'Statement Date[:\s]+(\d{1,2}/\d{1,2}/\d{2,4})', text, re.IGNORECASE)
-        if match:
-            parts = match.group(1).split('/')
-            if len(parts) == 3:
-                month, day, year = parts
-                if len(year) == 2:
-                    year = f"20{year}"
-                return f"{month.zfill(2)}/{day.zfill(2)}/{year}", "Chase Statement Date"
-
-        match = re.search(r'Closing Date[:\s]+(\d{1,2}/\d{1,2}/\d{2,4})', text, re.IGNORECASE)
+    # AMEX and Chase share the labelled-date format, so one finditer pass
+    # finds both labels; the loop stops as soon as the preferred label for
+    # the doc type is in hand (AMEX wants Closing Date, Chase prefers
+    # Statement Date and falls back to Closing Date).
+    if date_method in ('amex', 'chase'):
+        first_closing = None
+        first_statement = None
+        for match in _DATE_LABEL_RE.finditer(text):
+            if match.group(1)[0] in 'Cc':
+                if first_closing is None:
+                    first_closing = match
+                    if date_method == 'amex':
+                        break
+            elif date_method == 'chase':
+                first_statement = match
+                break
+
+        if date_method == 'amex':
+            match, label = first_closing, "Closing Date"
+        elif first_statement is not None:
+            match, label = first_statement, "Statement Date"
+        else:
+            match, label = first_closing, "Closing Date"
+
         if match:
-            parts = match.group(1).split('/')
-            if len(parts) == 3:
-                month, day, year = parts
-                if len(year) == 2:
-                    year = f"20{year}"
-                return f"{month.zfill(2)}/{day.zfill(2)}/{year}", "Chase Closing Date"
-
-    # Generic date extraction
-    matches = re.findall(r'\b(\d{1,2}/\d{1,2}/\d{4})\b', text)
-    if matches:
-        parts = matches[0].split('/')
-        month, day, year = parts
-        return f"{month.zfill(2)}/{day.zfill(2)}/{year}", "first date in document"
+            month, day, year = match.group(2), match.group(3), match.group(4)
+            if len(year) == 2:
+                year = f"20{year}"
+            prefix = "AMEX" if date_method == 'amex' else "Chase"
+            return f"{month.zfill(2)}/{day.zfill(2)}/{year}", f"{prefix} {label}"
+
+    # Generic date extraction - only the first hit matters, so stop the
+    # scan there instead of collecting every date in the document
+    match = _GENERIC_DATE_RE.search(text)
+    if match:
+        month, day, year = match.groups()
+        return f"{int(month):02d}/{int(day):02d}/{year}", "first date in document"
 
     # Filename fallback
-    match = re.search(r'(\d{4})(\d{2})(\d{2})', filename)
+    match = _COMPACT_DATE_RE.search(filename)
     if match:
         year, month, day = match.groups()
         return f"{month}/{day}/{year}", "filename"
 
-    match = re.search(r'\b(20\d{2})\b', filename)
+    match = _YEAR_RE.search(filename)
     if match:
         return f"12/31/{match.group(1)}", "filename year"
 
@@ -522,6 +789,20 @@ def extract_statement_date(text: str, filename: str, doc_config: dict) -> Tuple[
 # FOLDER AND FILE OPERATIONS
 # =============================================================================
 
+# Destination folders already ensured this run. A batch routes many PDFs
+# into the same (year, category, folder), and each mkdir(parents=True)
+# costs a stat per path component; moves run on the main process only, so
+# a plain set suffices.
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a destination folder once per run, skipping repeat syscalls."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
 def get_destination_folder(doc_config: dict, year: int, account_number: Optional[str] = None) -> Path:
     """
     Build destination path for a given year and create if needed.
@@ -534,37 +815,57 @@ def get_destination_folder(doc_config: dict, year: int, account_number: Optional
     Returns:
         Full destination folder path
     """
-    category = doc_config.get('destination_category', 'Bank Statements')
+    # Defaults were materialized into the config dicts at import, so these
+    # are direct key hits
+    category = doc_config['destination_category']
 
     # Determine folder name
-    if 'folder_name_template' in doc_config and account_number:
-        folder_name = doc_config['folder_name_template'].format(account=account_number)
+    template = doc_config.get('folder_name_template')
+    if template and account_number:
+        folder_name = template.format(account=account_number)
     else:
-        folder_name = doc_config.get('folder_name', doc_config['name'])
+        folder_name = doc_config['folder_name']
 
     year_folder = config.TAX_BASE_FOLDER / f"{year} Tax Year" / category
     destination = year_folder / folder_name
-    destination.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(destination)
 
     return destination
 
 
+def _split_mdy(date_str: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split and validate an MM/DD/YYYY string without datetime.strptime.
+
+    strptime re-interprets its format string on every call, which is pure
+    overhead when the only goal is splitting on '/' - these helpers run once
+    per organized file. Month/day ranges are checked; exact per-month day
+    counts are not, matching what the upstream date extractors can produce.
+    """
+    parts = date_str.split('/')
+    if len(parts) != 3:
+        return None
+    month, day, year = parts
+    if not (month.isdigit() and day.isdigit() and year.isdigit() and len(year) == 4):
+        return None
+    if not (1 <= int(month) <= 12 and 1 <= int(day) <= 31):
+        return None
+    return month, day, year
+
+
 def format_date_for_filename(date_str: str) -> Optional[str]:
     """Convert MM/DD/YYYY to MM_DD_YYYY."""
-    try:
-        date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-        return date_obj.strftime("%m_%d_%Y")
-    except ValueError:
+    parts = _split_mdy(date_str)
+    if parts is None:
         return None
+    month, day, year = parts
+    return f"{month.zfill(2)}_{day.zfill(2)}_{year}"
 
 
 def extract_year_from_date(date_str: str) -> Optional[int]:
     """Extract year from MM/DD/YYYY date string."""
-    try:
-        date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-        return date_obj.year
-    except ValueError:
-        return None
+    parts = _split_mdy(date_str)
+    return int(parts[2]) if parts else None
 
 
 # =============================================================================
@@ -647,7 +948,7 @@ def process_downloads(
     pdf_files = []
     for folder in config.SOURCE_FOLDERS:
         if folder.exists():
-            folder_pdfs = list(folder.glob("*.pdf"))
+            folder_pdfs = list(utils.iter_pdfs(folder))
             if folder_pdfs:
                 logger.info(f"Found {len(folder_pdfs)} PDF files in {folder.name}")
                 pdf_files.extend(folder_pdfs)
@@ -658,37 +959,113 @@ def process_downloads(
 
     logger.info(f"Found {len(pdf_files)} total PDF files across all source folders")
 
-    for pdf_file in pdf_files:
-        result = process_single_pdf(pdf_file, dry_run=dry_run)
-        if result:
-            if result['type'] == 'bank_statement':
-                moved_files.append(result)
-            elif result['type'] == 'categorized':
-                categorized_files.append(result)
+    # Text extraction dominates the per-file cost (MuPDF page iteration is
+    # CPU-bound) and is independent per file, so fan it out across cores
+    # when the batch is big enough to amortize process spawns. Detection is
+    # cheap after extraction, and file moves stay on the main process to
+    # avoid filesystem races - each worker only opens its own document.
+    # Files are consumed strictly in pdf_files order, so this counter
+    # doubles as the resume point if the parallel path dies mid-stream:
+    # everything before it was fully processed (moves included) and must
+    # not be redone or have its results discarded.
+    processed = 0
+
+    def _consume(pairs) -> None:
+        nonlocal processed
+        for pdf_file, text in pairs:
+            result = process_single_pdf(pdf_file, dry_run=dry_run, text=text)
+            if result:
+                if result['type'] == 'bank_statement':
+                    moved_files.append(result)
+                elif result['type'] == 'categorized':
+                    categorized_files.append(result)
+                else:
+                    uncategorized_files.append(pdf_file.name)
             else:
                 uncategorized_files.append(pdf_file.name)
-        else:
-            uncategorized_files.append(pdf_file.name)
+            processed += 1
+
+    if len(pdf_files) >= 4:
+        try:
+            # Consume executor.map lazily: classification and moves on the
+            # main process overlap with extraction still running in the
+            # workers, instead of waiting for the whole batch of texts
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                _consume(zip(pdf_files, executor.map(_extract_adaptive, pdf_files, chunksize=8)))
+        except Exception as e:
+            # Pool start-up failure or a worker dying mid-batch (e.g. a
+            # corrupt PDF crashing MuPDF). Moves already performed stay
+            # recorded; only the unconsumed tail is retried serially.
+            logger.debug(f"Parallel PDF extraction failed, falling back: {e}")
+
+    remaining = pdf_files[processed:]
+    if remaining:
+        _consume((pdf_file, _extract_adaptive(pdf_file)) for pdf_file in remaining)
 
     return moved_files, categorized_files, uncategorized_files
 
 
-def process_single_pdf(pdf_file: Path, dry_run: bool = False) -> Optional[dict]:
+def process_single_pdf(
+    pdf_file: Path, dry_run: bool = False, text: Optional[str] = None
+) -> Optional[dict]:
     """
     Process a single PDF file.
 
+    Args:
+        pdf_file: Path to the PDF
+        dry_run: Preview without moving files
+        text: Pre-extracted PDF text (skips extraction; used by the
+            parallel batch path in process_downloads)
+
     Returns:
         Result dictionary or None if could not process
     """
-    text = extract_text_from_pdf(pdf_file)
+    if text is None:
+        text = extract_text_from_pdf(pdf_file)
 
-    # Try to detect as bank statement first
-    doc_type, doc_config = detect_document_type(pdf_file.name, text)
+    # A work-document token in the filename disqualifies the file outright
+    # (conservative by design - never file work documents as tax docs), so
+    # bail before paying for the multi-MB text.upper() and keyword scans
+    filename_upper = pdf_file.name.upper()
+    if _GLOBAL_EXCLUSIONS_RE.search(filename_upper):
+        return None
+
+    # Uppercase once; every detector downstream works on these copies.
+    # A single smart quote or (R) symbol in the PDF forces CPython onto the
+    # wide (2/4-byte) string representation, where substring and regex
+    # scans lose the memchr fast path - so squash to ASCII up front. Every
+    # keyword is ASCII, and replaced chars ('?') can't produce false hits.
+    no_text = not text or text == "NO_TEXT" or text.startswith("ERROR:")
+    if no_text:
+        text_upper = ""
+    else:
+        text_upper = text.upper()
+        if not text_upper.isascii():
+            text_upper = text_upper.encode("ascii", "replace").decode("ascii")
+
+    # Classification is pure, so reuse a previous run's verdict for an
+    # unchanged document instead of re-running the keyword scans
+    cache = _get_classify_cache()
+    key = _classify_key(filename_upper, text_upper)
+    cached = cache.get(key)
+
+    if cached is not None:
+        doc_type, category_id, confidence = cached
+        doc_config = DOCUMENT_TYPES.get(doc_type) if doc_type else None
+        category = (category_id, confidence)
+    else:
+        # Try to detect as bank statement first
+        doc_type, doc_config = detect_document_type(filename_upper, text_upper)
+        if doc_type:
+            category = (None, 0)
+        else:
+            category = categorize_document(filename_upper, text_upper, no_text)
+        cache[key] = [doc_type, category[0], category[1]]
 
     if doc_type:
         return process_bank_statement(pdf_file, text, doc_type, doc_config, dry_run)
     else:
-        return process_general_document(pdf_file, text, dry_run)
+        return process_general_document(pdf_file, text, text_upper, no_text, dry_run, category=category)
 
 
 def process_bank_statement(
@@ -766,9 +1143,19 @@ def process_bank_statement(
     }
 
 
-def process_general_document(pdf_file: Path, text: str, dry_run: bool = False) -> Optional[dict]:
+def process_general_document(
+    pdf_file: Path,
+    text: str,
+    text_upper: str,
+    no_text: bool,
+    dry_run: bool = False,
+    category: Optional[Tuple[Optional[str], int]] = None,
+) -> Optional[dict]:
     """Process a general (non-bank) document."""
-    category_id, confidence = categorize_document(pdf_file.name, text)
+    if category is not None:
+        category_id, confidence = category
+    else:
+        category_id, confidence = categorize_document(pdf_file.name.upper(), text_upper, no_text)
 
     # Accept 75%+ confidence (allows filename-only matches for scanned PDFs)
     if not category_id or confidence < 75:
@@ -777,20 +1164,18 @@ def process_general_document(pdf_file: Path, text: str, dry_run: bool = False) -
     cat_config = DOCUMENT_CATEGORIES[category_id]
 
     # Extract year from document
-    date_matches = re.findall(r'\b(\d{1,2}/\d{1,2}/\d{4})\b', text)
-    if date_matches:
-        try:
-            date_obj = datetime.strptime(date_matches[0], "%m/%d/%Y")
-            doc_year = date_obj.year
-        except ValueError:
-            doc_year = datetime.now().year
+    date_match = _GENERIC_DATE_RE.search(text)
+    if date_match:
+        # The regex already validated the digit layout; only the year is
+        # needed here, so skip the strptime round-trip entirely
+        doc_year = int(date_match.group(3))
     else:
-        year_match = re.search(r'\b(20\d{2})\b', pdf_file.name)
+        year_match = _YEAR_RE.search(pdf_file.name)
         doc_year = int(year_match.group(1)) if year_match else datetime.now().year
 
     # Create destination
     dest_folder = config.TAX_BASE_FOLDER / f"{doc_year} Tax Year" / cat_config['folder']
-    dest_folder.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dest_folder)
 
     dest_path = dest_folder / pdf_file.name
 
@@ -837,21 +1222,56 @@ def audit_tax_folders(
 
     logger.info("Auditing tax folders for misplaced files...")
 
-    for pdf_file in config.TAX_BASE_FOLDER.rglob("*.pdf"):
-        text = extract_text_from_pdf(pdf_file)
-        if not text or text == "NO_TEXT" or text.startswith("ERROR:"):
+    # The audit verdict is deterministic in the file's content, so a file
+    # already verified in place with the same (size, mtime_ns) can skip
+    # extraction and classification entirely on subsequent runs. Only files
+    # that stayed put are recorded; anything moved vanishes from its old
+    # path and naturally misses the cache.
+    audit_cache = _load_audit_cache()
+    fresh_cache: Dict[str, list] = {}
+
+    # First pass: stat against the cache and collect only the stale files.
+    # Extraction for those runs below, threaded when the batch is big
+    # enough - MuPDF releases the GIL while parsing, so threads overlap the
+    # actual work without the spawn cost of a process pool.
+    stale_files: List[Path] = []
+    for pdf_file in utils.iter_pdfs(config.TAX_BASE_FOLDER, recursive=True):
+        path_str = str(pdf_file)
+        try:
+            st = os.stat(pdf_file)
+        except OSError:
             continue
+        cached = audit_cache.get(path_str)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            fresh_cache[path_str] = cached
+            continue
+        # Optimistically record the file as clean; the move branch below
+        # drops the entry before touching it
+        fresh_cache[path_str] = [st.st_size, st.st_mtime_ns]
+        stale_files.append(pdf_file)
+
+    def _audit_one(pdf_file: Path, text: str) -> None:
+        """Classify one extracted file and fix its location; runs serially."""
+        path_str = str(pdf_file)
+        if not text or text == "NO_TEXT" or text.startswith("ERROR:"):
+            return
 
-        doc_type, doc_config = detect_document_type(pdf_file.name, text)
+        text_upper = text.upper()
+        if not text_upper.isascii():
+            # Same ASCII squash as process_single_pdf: keep scans on the
+            # compact string representation
+            text_upper = text_upper.encode("ascii", "replace").decode("ascii")
+
+        doc_type, doc_config = detect_document_type(pdf_file.name.upper(), text_upper)
 
         if doc_type:
             date_str, _ = extract_statement_date(text, pdf_file.name, doc_config)
             if not date_str:
-                continue
+                return
 
             year = extract_year_from_date(date_str)
             if not year:
-                continue
+                return
 
             # Check if in correct location
             account_number = doc_config.get('account_number')
@@ -864,29 +1284,40 @@ def audit_tax_folders(
             correct_folder = get_destination_folder(doc_config, year, account_number)
             formatted_date = format_date_for_filename(date_str)
             if not formatted_date:
-                continue
+                return
 
             correct_name = f"{formatted_date} - {account_number}.pdf"
             correct_path = correct_folder / correct_name
 
-            if pdf_file.resolve() == correct_path.resolve():
-                continue
+            # Both sides descend from the already-resolved TAX_BASE_FOLDER,
+            # so plain string comparison replaces resolve()'s
+            # stat/readlink syscalls per path component
+            if os.fspath(pdf_file) == os.fspath(correct_path):
+                return
 
-            if pdf_file.parent.resolve() == correct_folder.resolve():
-                continue
+            if os.fspath(pdf_file.parent) == os.fspath(correct_folder):
+                return
 
             if correct_path.exists():
+                # The file is misplaced but its slot is taken, so nothing
+                # is moved. That verdict depends on the destination's
+                # occupancy, not on this file's (size, mtime) - caching it
+                # would stop the audit from revisiting the file once the
+                # conflict clears, so keep it out of the cache either way.
+                fresh_cache.pop(path_str, None)
                 if utils.files_are_identical(pdf_file, correct_path):
-                    continue
-                continue
+                    return
+                return
 
-            # Move misplaced file
+            # Move misplaced file (or report it): either way the file is
+            # not verified in place, so keep it out of the audit cache
+            fresh_cache.pop(path_str, None)
             if not dry_run:
                 try:
                     shutil.move(str(pdf_file), str(correct_path))
                     logger.info(f"Fixed: {pdf_file.name} -> {correct_path.relative_to(config.TAX_BASE_FOLDER)}")
                 except Exception:
-                    continue
+                    return
             else:
                 logger.info(f"Would fix: {pdf_file.name} -> {correct_path.relative_to(config.TAX_BASE_FOLDER)}")
 
@@ -900,6 +1331,17 @@ def audit_tax_folders(
                 'dry_run': dry_run,
             })
 
+    # Second pass: extract in parallel, classify and move serially on the
+    # main thread so filesystem mutations never race
+    if len(stale_files) >= 4:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for pdf_file, text in zip(stale_files, executor.map(_extract_adaptive, stale_files)):
+                _audit_one(pdf_file, text)
+    else:
+        for pdf_file in stale_files:
+            _audit_one(pdf_file, _extract_adaptive(pdf_file))
+
+    _save_audit_cache(fresh_cache)
     return moved_files, categorized_files, uncategorized_files
 
 
@@ -15,16 +15,23 @@ WHAT IT DOES:
     6. Comprehensive logging with debugging info
 """
 
+import functools
+import heapq
 import logging
+import os
+import stat
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Optional, Tuple
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 from downloads_organizer import config
+from downloads_organizer import media_organizer
+from downloads_organizer import pdf_organizer
 from downloads_organizer import utils
 from downloads_organizer import notifications
 
@@ -35,6 +42,70 @@ last_pdf_run = 0
 last_media_run = 0
 organizer_lock = threading.Lock()
 
+# Entries whose deadlines fall within this many seconds of the batch being
+# drained are included in it, so a burst scheduled microseconds apart is
+# processed as one batch instead of one wakeup per file
+_BATCH_SLACK = 0.1
+
+# Extension -> organizer route, built once so event classification is a
+# single dict probe instead of an equality test plus a set membership test
+_EXT_KIND = {
+    config.PDF_EXTENSION: "pdf",
+    **{ext: "media" for ext in config.ALL_MEDIA_EXTENSIONS},
+}
+
+# Names that produce the bulk of Downloads-folder event churn and can
+# never become organizer input - dropped before any handler runs
+_IGNORED_SUFFIXES = (".crdownload", ".part", ".tmp", ".download", "~")
+_IGNORED_NAMES = frozenset({".ds_store", ".localized"})
+
+
+@functools.lru_cache(maxsize=256)
+def _pdf_magic_cached(path_str: str, st_ino: int, st_size: int) -> bool:
+    """Read the 5-byte PDF magic number, memoized per (path, inode, size).
+
+    Browsers emit a cascade of events for the same file while a download
+    settles; the cache keeps that from re-opening the file per event, and
+    a negative result is cached too so partial downloads are not re-read.
+    A size or inode change naturally forms a new key.
+    """
+    try:
+        with open(path_str, 'rb') as f:
+            return f.read(5) == b'%PDF-'
+    except OSError:
+        return False
+
+
+def _count_by_kind(folder: Path) -> Tuple[int, int]:
+    """
+    Count PDF and media files in a folder with a single directory pass.
+
+    One scandir sweep replaces a glob per extension - each glob re-reads
+    the whole directory, which adds up on a busy Downloads folder.
+
+    Returns:
+        Tuple of (pdf_count, media_count)
+    """
+    pdfs = media = 0
+    kinds = _EXT_KIND
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if dot <= 0:
+                    continue
+                kind = kinds.get(name[dot:].lower())
+                if kind == "pdf":
+                    pdfs += 1
+                elif kind == "media":
+                    media += 1
+    except OSError:
+        pass
+    return pdfs, media
+
 
 def run(
     pdf_only: bool = False,
@@ -54,7 +125,7 @@ def run(
     # Verify at least one source folder exists
     available_folders = [f for f in config.SOURCE_FOLDERS if f.exists()]
     if not available_folders:
-        logger.error(f"No source folders found. Checked: {config.SOURCE_FOLDERS}")
+        logger.error("No source folders found. Checked: %s", config.SOURCE_FOLDERS)
         return
 
     logger.info("=" * 60)
@@ -62,9 +133,9 @@ def run(
     logger.info("=" * 60)
     logger.info("Watching folders:")
     for folder in available_folders:
-        logger.info(f"  - {folder}")
-    logger.info(f"Debounce delay: {config.DEBOUNCE_SECONDS} seconds")
-    logger.info(f"Periodic scan: Every {config.PERIODIC_SCAN_INTERVAL} seconds")
+        logger.info("  - %s", folder)
+    logger.info("Debounce delay: %s seconds", config.DEBOUNCE_SECONDS)
+    logger.info("Periodic scan: Every %s seconds", config.PERIODIC_SCAN_INTERVAL)
 
     # Determine what to watch
     watch_pdf = not media_only
@@ -84,10 +155,19 @@ def run(
         media_enabled=watch_media,
         watched_folders=available_folders
     )
-    observer = Observer()
+    # Observer() picks the kernel-event backend for the platform (FSEvents
+    # on macOS, inotify on Linux) - free while idle. The polling backend is
+    # opt-in for network mounts where kernel events silently go missing,
+    # with a long interval since each tick re-lists every watched folder.
+    if config.WATCHER_FORCE_POLLING:
+        from watchdog.observers.polling import PollingObserver
+        observer = PollingObserver(timeout=config.WATCHER_POLL_INTERVAL)
+        logger.info("Using polling backend (interval: %ss)", config.WATCHER_POLL_INTERVAL)
+    else:
+        observer = Observer()
     for folder in available_folders:
         observer.schedule(event_handler, str(folder), recursive=False)
-        logger.info(f"Scheduled watcher for: {folder}")
+        logger.info("Scheduled watcher for: %s", folder)
 
     # Start periodic scan thread
     scan_thread = threading.Thread(
@@ -101,9 +181,11 @@ def run(
     observer.start()
     logger.info("File watcher started")
 
+    # Block on the observer thread instead of a 1 Hz sleep loop: the main
+    # thread parks until Ctrl+C interrupts the join, so an idle watcher
+    # takes zero wakeups instead of one per second
     try:
-        while True:
-            time.sleep(1)
+        observer.join()
     except KeyboardInterrupt:
         logger.info("Stopping watcher...")
         observer.stop()
@@ -128,17 +210,66 @@ class DownloadsHandler(FileSystemEventHandler):
         super().__init__()
         self.pdf_enabled = pdf_enabled
         self.media_enabled = media_enabled
+        # Route -> enabled flag, so triage asks one table instead of
+        # branching per type on separate attributes
+        self._route_enabled = {"pdf": pdf_enabled, "media": media_enabled}
         self.watched_folders = watched_folders or [config.DOWNLOADS_FOLDER]
-        self.pending_files: Set[str] = set()
-        self.lock = threading.Lock()
+        # Bind the config values the per-event paths consult onto the
+        # instance once: an attribute load on self beats a module-attribute
+        # chase through config on every event, and the values never change
+        # for the lifetime of a handler anyway
+        self._debounce = config.DEBOUNCE_SECONDS
+        self._min_interval = config.MIN_RUN_INTERVAL
+        self._scan_interval = config.PERIODIC_SCAN_INTERVAL
+        self._processed_ttl = config.PROCESSED_TTL
+        self._stable_interval = config.STABILITY_CHECK_INTERVAL
+        # Files already handed to an organizer, keyed by (path, mtime_ns,
+        # size) - an unchanged leftover is not re-queued for PROCESSED_TTL
+        # seconds. Any modification changes the key, so real new content
+        # always gets through. Bounded; expired entries evicted on insert.
+        self._processed: OrderedDict = OrderedDict()
+        # Debounce scheduler: one long-lived worker drains a min-heap of
+        # (ready_time, path, file_type) entries instead of spawning a
+        # sleeping thread per event. _pending records the keys currently
+        # queued, so a burst of events for the same file collapses into
+        # one entry; duplicates are dropped without taking the lock.
+        self._cv = threading.Condition()
+        self._heap: list = []
+        self._pending: Dict[Tuple[str, str], float] = {}
+        # Paths the kernel has reported closed-for-write (Linux inotify
+        # only); the stability poll is unnecessary for these
+        self._closed_paths: set = set()
+        # Per-folder mtime recorded by the periodic scan when a sweep
+        # found nothing to do - lets idle folders be skipped with one stat
+        self._clean_dir_mtime: Dict[str, int] = {}
+        # Organizer types currently executing - the debounce worker and
+        # the periodic scan thread both call _run_organizer, and a run
+        # must not overlap another of the same type
+        self._in_flight: set = set()
+        self._worker = threading.Thread(target=self._debounce_loop, daemon=True)
+        self._worker.start()
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Drop temp-file churn before watchdog's per-method dispatch.
+
+        Browser downloads generate streams of events for .crdownload/.part
+        files; a string check on the final name here keeps them from ever
+        reaching the handlers (and their is_file stat). A moved event is
+        judged by its destination name, so the .crdownload -> .pdf rename
+        still gets through. A full PatternMatchingEventHandler allow-list
+        is not usable because extensionless PDFs must pass.
+        """
+        name = os.path.basename(getattr(event, 'dest_path', '') or event.src_path).lower()
+        if name in _IGNORED_NAMES or name.endswith(_IGNORED_SUFFIXES):
+            return
+        super().dispatch(event)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle new file creation."""
         if event.is_directory:
             return
 
-        file_path = Path(event.src_path)
-        self._process_file_event(file_path, "created")
+        self._process_file_event(event.src_path, "created")
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file renames/moves - common during downloads."""
@@ -146,102 +277,218 @@ class DownloadsHandler(FileSystemEventHandler):
             return
 
         # Process the destination path (final filename)
-        dest_path = Path(event.dest_path)
-        src_name = Path(event.src_path).name
-        logger.info(f"File renamed: {src_name} -> {dest_path.name}")
-        self._process_file_event(dest_path, "renamed")
-
-    def _process_file_event(self, file_path: Path, event_type: str) -> None:
-        """Process a file event and route to appropriate organizer."""
-        if not file_path.is_file():
+        logger.info(
+            "File renamed: %s -> %s",
+            os.path.basename(event.src_path),
+            os.path.basename(event.dest_path),
+        )
+        self._process_file_event(event.dest_path, "renamed")
+
+    def on_closed(self, event: FileSystemEvent) -> None:
+        """Handle close-after-write - the kernel saying a download finished.
+
+        watchdog only emits FileClosedEvent on Linux (IN_CLOSE_WRITE); on
+        macOS/Windows this never fires and the size poll below remains the
+        stability check.
+        """
+        if event.is_directory:
             return
 
-        ext = file_path.suffix.lower()
+        if len(self._closed_paths) > 256:
+            self._closed_paths.clear()
+        self._closed_paths.add(event.src_path)
+        self._process_file_event(event.src_path, "closed")
+
+    def _process_file_event(self, path_str: str, event_type: str) -> None:
+        """Process a file event and route to appropriate organizer.
+
+        Triage works on the raw event string first: slicing out the
+        extension and probing the route table costs no syscalls and no
+        Path construction, so events for types we do not handle are
+        rejected before any stat. Events that survive triage are stat'd
+        exactly once - the regular-file check, the magic-byte cache key
+        and (for PDFs) the content probe all reuse the same result.
+        """
+        name = os.path.basename(path_str)
+        dot = name.rfind(".")
+        kind = _EXT_KIND.get(name[dot:].lower()) if dot > 0 else None
 
-        # Check if this is a PDF (by extension or content)
-        if self.pdf_enabled:
-            if ext == config.PDF_EXTENSION:
-                logger.info(f"New PDF {event_type}: {file_path.name}")
-                self.schedule_processing(file_path, "pdf")
+        if kind is not None:
+            if not self._route_enabled[kind]:
                 return
-            # Check for PDF without extension (common with Chrome downloads)
-            elif not ext or ext not in config.ALL_MEDIA_EXTENSIONS:
-                if self._is_pdf_by_content(file_path):
-                    logger.info(f"New PDF (no extension) {event_type}: {file_path.name}")
-                    # Rename to add .pdf extension
-                    new_path = file_path.with_suffix('.pdf')
-                    try:
-                        file_path.rename(new_path)
-                        logger.info(f"Renamed to: {new_path.name}")
-                        self.schedule_processing(new_path, "pdf")
-                    except Exception as e:
-                        logger.error(f"Failed to rename {file_path.name}: {e}")
-                    return
+            st = self._stat_regular(path_str)
+            if st is not None and not self._recently_processed(path_str, st):
+                logger.info("New %s file %s: %s", kind, event_type, name)
+                self.schedule_processing(Path(path_str), kind)
+            return
 
-        # Check if this is a media file
-        if ext in config.ALL_MEDIA_EXTENSIONS and self.media_enabled:
-            logger.info(f"New media file {event_type}: {file_path.name}")
-            self.schedule_processing(file_path, "media")
+        # Unknown extension: check for a PDF downloaded without one
+        # (common with Chrome downloads)
+        if not self.pdf_enabled:
             return
+        st = self._stat_regular(path_str)
+        if st and _pdf_magic_cached(path_str, st.st_ino, st.st_size):
+            logger.info("New PDF (no extension) %s: %s", event_type, name)
+            # Rename to add .pdf extension
+            file_path = Path(path_str)
+            new_path = file_path.with_suffix('.pdf')
+            try:
+                file_path.rename(new_path)
+                logger.info("Renamed to: %s", new_path.name)
+                self.schedule_processing(new_path, "pdf")
+            except Exception as e:
+                logger.error("Failed to rename %s: %s", name, e)
 
-    def _is_pdf_by_content(self, file_path: Path) -> bool:
-        """Check if file is a PDF by reading magic bytes."""
+    @staticmethod
+    def _stat_regular(path_str: str) -> Optional[os.stat_result]:
+        """Stat a path once, returning the result only for regular files."""
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(5)
-                return header == b'%PDF-'
-        except Exception:
+            st = os.stat(path_str, follow_symlinks=False)
+        except OSError:
+            return None
+        return st if stat.S_ISREG(st.st_mode) else None
+
+    def _recently_processed(self, path_str: str, st: os.stat_result) -> bool:
+        """Check whether this exact file version was already handled."""
+        handled_at = self._processed.get((path_str, st.st_mtime_ns, st.st_size))
+        if handled_at is None:
             return False
+        if time.monotonic() - handled_at > self._processed_ttl:
+            return False
+        logger.debug("Already processed recently: %s", os.path.basename(path_str))
+        return True
+
+    def _mark_processed(self, path_str: str) -> None:
+        """Record a file version as handled, if it survived the run.
+
+        A file the organizer moved away fails the stat and is simply not
+        recorded; only leftovers that are still sitting in the folder
+        unchanged get an entry suppressing their follow-up events.
+        """
+        st = self._stat_regular(path_str)
+        if st is None:
+            return
+        now = time.monotonic()
+        # Entries were inserted in time order, so expiry trims the front
+        while self._processed:
+            _, oldest = next(iter(self._processed.items()))
+            if now - oldest <= self._processed_ttl and len(self._processed) < 1024:
+                break
+            self._processed.popitem(last=False)
+        self._processed[(path_str, st.st_mtime_ns, st.st_size)] = now
 
     def schedule_processing(self, file_path: Path, file_type: str) -> None:
         """Schedule a file for processing after debounce delay."""
         file_key = (str(file_path), file_type)
 
-        with self.lock:
-            if str(file_key) in self.pending_files:
-                logger.debug(f"File already pending: {file_path.name}")
+        # Lock-free fast path: dict membership is atomic under the GIL, so
+        # the stream of duplicate events a settling download generates is
+        # dropped without ever touching the condition variable. The first
+        # event wins and its deadline stands; a file still being written
+        # when its batch fires is caught by the stability check, and the
+        # periodic scan backstops anything that slips past it.
+        if file_key in self._pending:
+            logger.debug("File already pending: %s", file_path.name)
+            return
+
+        ready_time = time.monotonic() + self._debounce
+        with self._cv:
+            if self._pending.setdefault(file_key, ready_time) != ready_time:
+                # Another event thread queued this key between the check
+                # above and the lock - nothing more to do
                 return
-            self.pending_files.add(str(file_key))
+            heapq.heappush(self._heap, (ready_time, file_key[0], file_type))
+            self._cv.notify()
 
-        def process_after_debounce():
+    def _debounce_loop(self) -> None:
+        """Worker thread: drain due entries in batches and process them."""
+        while True:
+            due: list = []
+            with self._cv:
+                while not self._heap:
+                    self._cv.wait()
+                # Drain everything that is due in one sweep so a burst of
+                # downloads becomes one batch, not one wakeup per file
+                now = time.monotonic() + _BATCH_SLACK
+                while self._heap and self._heap[0][0] <= now:
+                    ready_time, path_str, file_type = heapq.heappop(self._heap)
+                    self._pending.pop((path_str, file_type), None)
+                    due.append((path_str, file_type))
+                if not due:
+                    self._cv.wait(self._heap[0][0] - now)
+                    continue
             try:
-                # Wait for file to finish downloading
-                time.sleep(config.DEBOUNCE_SECONDS)
-
-                with self.lock:
-                    self.pending_files.discard(str(file_key))
-
-                # Verify file exists (might have been renamed)
-                if not file_path.exists():
-                    logger.debug(f"File no longer exists: {file_path.name}")
-                    return
-
-                # Wait for file to finish downloading (check size stability)
-                if not self._wait_for_stable_size(file_path):
-                    logger.debug(f"File still changing: {file_path.name}")
-                    return
-
-                # Run the appropriate organizer
-                logger.info(f"Triggering {file_type} organizer for: {file_path.name}")
-                self._run_organizer(file_type)
-
+                self._process_batch(due)
             except Exception as e:
-                logger.error(f"Error processing {file_path.name}: {e}")
-                with self.lock:
-                    self.pending_files.discard(str(file_key))
+                logger.error("Error processing debounce batch: %s", e)
 
-        thread = threading.Thread(target=process_after_debounce, daemon=True)
-        thread.start()
+    def _process_batch(self, due: list) -> None:
+        """Check each due file and fire each organizer at most once.
 
-    def _wait_for_stable_size(self, file_path: Path, timeout: int = 10) -> bool:
+        The organizers scan the whole source folder anyway, so ten PDFs
+        landing together need one PDF organizer run, not ten - this is
+        what collapses an N-file burst into a single invocation.
+        """
+        dirty = []
+        ready = []
+        for path_str, file_type in due:
+            # The stability check's first stat doubles as the existence
+            # check, so a file that was renamed away or is still being
+            # written is skipped with the same syscall either way
+            if not self._wait_for_stable_size(path_str):
+                logger.debug("Not ready (gone or still changing): %s",
+                             os.path.basename(path_str))
+                continue
+
+            logger.info("Ready for %s organizer: %s",
+                        file_type, os.path.basename(path_str))
+            ready.append(path_str)
+            if file_type not in dirty:
+                dirty.append(file_type)
+
+        for file_type in dirty:
+            self._run_organizer(file_type)
+
+        # Whatever the organizers left behind unchanged is remembered so
+        # its follow-up events stop re-queueing it for a while
+        for path_str in ready:
+            self._mark_processed(path_str)
+
+    def _wait_for_stable_size(self, path_str: str, timeout: int = 10) -> bool:
         """Wait for file size to stabilize (download complete)."""
+        # Skip the poll when the kernel already told us the writer closed
+        if path_str in self._closed_paths:
+            self._closed_paths.discard(path_str)
+            return True
+
+        # Probe through an open descriptor: the path is resolved once at
+        # open, and the two samples are fstat calls on the fd rather than
+        # full path walks. O_NOATIME (where the platform has it) keeps the
+        # read from dirtying the inode's atime; it requires owning the
+        # file, so fall back without it rather than fail.
+        flags = os.O_RDONLY | os.O_CLOEXEC | getattr(os, "O_NOATIME", 0)
         try:
-            size1 = file_path.stat().st_size
-            time.sleep(1)
-            size2 = file_path.stat().st_size
-            return size1 == size2
+            fd = os.open(path_str, flags)
+        except PermissionError:
+            try:
+                fd = os.open(path_str, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError:
+                return False
+        except OSError:
+            return False
+
+        try:
+            st1 = os.fstat(fd)
+            # The debounce window already absorbed most of the wait; a
+            # short pause comparing size and mtime catches active writers
+            # without the old 1-second latency floor
+            time.sleep(self._stable_interval)
+            st2 = os.fstat(fd)
+            return (st1.st_size, st1.st_mtime_ns) == (st2.st_size, st2.st_mtime_ns)
         except OSError:
             return False
+        finally:
+            os.close(fd)
 
     def _run_organizer(self, file_type: str) -> None:
         """Run the appropriate organizer."""
@@ -249,16 +496,25 @@ class DownloadsHandler(FileSystemEventHandler):
         current_time = time.time()
 
         with organizer_lock:
+            # An organizer of this type already executing (the periodic
+            # scan and the debounce worker can race here) means this
+            # trigger's files will be swept up by it or by the next scan -
+            # stronger than the time throttle alone, which only looks at
+            # when the last run *started*
+            if file_type in self._in_flight:
+                logger.debug("Skipping %s organizer run (already running)", file_type)
+                return
             if file_type == "pdf":
-                if current_time - last_pdf_run < config.MIN_RUN_INTERVAL:
+                if current_time - last_pdf_run < self._min_interval:
                     logger.debug("Skipping PDF organizer run (too soon)")
                     return
                 last_pdf_run = current_time
             elif file_type == "media":
-                if current_time - last_media_run < config.MIN_RUN_INTERVAL:
+                if current_time - last_media_run < self._min_interval:
                     logger.debug("Skipping media organizer run (too soon)")
                     return
                 last_media_run = current_time
+            self._in_flight.add(file_type)
 
         try:
             if file_type == "pdf":
@@ -266,73 +522,46 @@ class DownloadsHandler(FileSystemEventHandler):
             elif file_type == "media":
                 self._run_media_organizer()
         except Exception as e:
-            logger.error(f"Error running {file_type} organizer: {e}")
+            logger.error("Error running %s organizer: %s", file_type, e)
+        finally:
+            with organizer_lock:
+                self._in_flight.discard(file_type)
 
     def _run_pdf_organizer(self) -> None:
-        """Run the PDF organizer as a subprocess to avoid module caching issues."""
-        import subprocess
-
+        """Run the PDF organizer in-process, like the media organizer."""
         # Count PDFs before (across all source folders)
         pdf_count_before = sum(
-            len(list(folder.glob("*.pdf")))
+            _count_by_kind(folder)[0]
             for folder in config.SOURCE_FOLDERS if folder.exists()
         )
-        logger.info(f"Running PDF organizer (PDFs before: {pdf_count_before})")
+        logger.info("Running PDF organizer (PDFs before: %s)", pdf_count_before)
 
         try:
-            # Run as subprocess to ensure fresh module state
-            result = subprocess.run(
-                [
-                    "/usr/bin/python3",
-                    "/Users/mdmac/downloads-organizer/src/downloads_organizer/pdf_organizer.py",
-                    "--yes"
-                ],
-                env={
-                    "PYTHONPATH": "/Users/mdmac/downloads-organizer/src",
-                    "HOME": "/Users/mdmac",
-                    "PATH": "/usr/bin:/bin"
-                },
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            pdf_organizer.run(auto_yes=True)
 
             # Count PDFs after
             pdf_count_after = sum(
-                len(list(folder.glob("*.pdf")))
+                _count_by_kind(folder)[0]
                 for folder in config.SOURCE_FOLDERS if folder.exists()
             )
             files_moved = pdf_count_before - pdf_count_after
 
-            logger.info(f"PDF organizer complete (moved: {files_moved})")
+            logger.info("PDF organizer complete (moved: %s)", files_moved)
 
-            if result.returncode != 0:
-                logger.error(f"PDF organizer error: {result.stderr}")
-
-        except subprocess.TimeoutExpired:
-            logger.error("PDF organizer timed out after 120 seconds")
         except Exception as e:
-            logger.error(f"PDF organizer failed: {e}")
+            logger.error("PDF organizer failed: %s", e)
 
     def _run_media_organizer(self) -> None:
         """Run the media organizer on Downloads folder."""
-        from downloads_organizer import media_organizer
-
         # Count media files before
-        media_count_before = sum(
-            len(list(config.DOWNLOADS_FOLDER.glob(f"*{ext}")))
-            for ext in config.ALL_MEDIA_EXTENSIONS
-        )
-        logger.info(f"Running media organizer (media files before: {media_count_before})")
+        media_count_before = _count_by_kind(config.DOWNLOADS_FOLDER)[1]
+        logger.info("Running media organizer (media files before: %s)", media_count_before)
 
         try:
             photos, videos, audio = media_organizer.run(auto_yes=True)
 
             # Count media files after
-            media_count_after = sum(
-                len(list(config.DOWNLOADS_FOLDER.glob(f"*{ext}")))
-                for ext in config.ALL_MEDIA_EXTENSIONS
-            )
+            media_count_after = _count_by_kind(config.DOWNLOADS_FOLDER)[1]
             files_moved = media_count_before - media_count_after
             total_organized = photos + videos + audio
 
@@ -345,7 +574,7 @@ class DownloadsHandler(FileSystemEventHandler):
                 logger.warning("Media files found in Downloads but none were moved")
 
         except Exception as e:
-            logger.error(f"Media organizer failed: {e}")
+            logger.error("Media organizer failed: %s", e)
 
     def periodic_scan(self) -> None:
         """
@@ -357,61 +586,98 @@ class DownloadsHandler(FileSystemEventHandler):
         - Race conditions during file rename/move operations
         - Network drives with delayed file system events
         """
-        logger.info(f"Periodic scan started (runs every {config.PERIODIC_SCAN_INTERVAL} seconds)")
+        logger.info("Periodic scan started (runs every %s seconds)", self._scan_interval)
+        min_age = self._debounce + 5
 
         while True:
             try:
-                time.sleep(config.PERIODIC_SCAN_INTERVAL)
+                time.sleep(self._scan_interval)
 
                 current_time = time.time()
-                min_age = config.DEBOUNCE_SECONDS + 5
 
-                # Scan all watched folders
+                # Scan all watched folders: one scandir sweep per folder
+                # classifies and age-filters every entry, instead of a glob
+                # per extension plus a separate stat per hit
                 all_pdfs = []
                 all_media = []
 
                 for folder in self.watched_folders:
-                    if not folder.exists():
+                    folder_str = os.fspath(folder)
+                    # Adding, removing or renaming an entry bumps the
+                    # directory's own mtime, so a folder unchanged since a
+                    # sweep that found nothing costs one stat, not a listing
+                    try:
+                        dir_mtime = os.stat(folder_str).st_mtime_ns
+                    except OSError:
+                        continue
+                    if dir_mtime == self._clean_dir_mtime.get(folder_str):
                         continue
 
-                    # Collect PDFs
-                    if self.pdf_enabled:
-                        pdfs = list(folder.glob("*.pdf"))
-                        all_pdfs.extend([
-                            pdf for pdf in pdfs
-                            if current_time - pdf.stat().st_mtime > min_age
-                        ])
-
-                    # Collect media files
-                    if self.media_enabled:
-                        for ext in config.ALL_MEDIA_EXTENSIONS:
-                            media_files = list(folder.glob(f"*{ext}")) + list(folder.glob(f"*{ext.upper()}"))
-                            all_media.extend([
-                                f for f in media_files
-                                if current_time - f.stat().st_mtime > min_age
-                            ])
+                    found = len(all_pdfs) + len(all_media)
+                    saw_young = False
+                    try:
+                        entries = os.scandir(folder_str)
+                    except OSError:
+                        continue
+                    with entries:
+                        for entry in entries:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            name = entry.name
+                            dot = name.rfind(".")
+                            if dot <= 0:
+                                continue
+                            kind = _EXT_KIND.get(name[dot:].lower())
+                            if kind is None or not self._route_enabled[kind]:
+                                continue
+                            try:
+                                # DirEntry.stat reuses the data fetched
+                                # during the directory read where possible
+                                st = entry.stat()
+                            except OSError:
+                                continue
+                            if current_time - st.st_mtime <= min_age:
+                                # Still inside the settle window - it will
+                                # age past min_age without touching the
+                                # directory mtime, so this folder must not
+                                # be marked clean below
+                                saw_young = True
+                                continue
+                            if kind == "pdf":
+                                all_pdfs.append(Path(entry.path))
+                            else:
+                                all_media.append(Path(entry.path))
+
+                    # Only a sweep with no actionable and no still-young
+                    # files proves the folder clean at this mtime; a sweep
+                    # that found work may leave files behind (failed move,
+                    # throttled run) that a later pass must retry
+                    if saw_young or len(all_pdfs) + len(all_media) > found:
+                        self._clean_dir_mtime.pop(folder_str, None)
+                    else:
+                        self._clean_dir_mtime[folder_str] = dir_mtime
 
                 # Process PDFs
                 if all_pdfs:
-                    logger.info(f"Periodic scan: Found {len(all_pdfs)} PDF(s) across all folders, running organizer...")
+                    logger.info("Periodic scan: Found %s PDF(s) across all folders, running organizer...", len(all_pdfs))
                     for pdf in all_pdfs[:5]:
                         age = int(current_time - pdf.stat().st_mtime)
-                        logger.debug(f"  - {pdf.name} (age: {age}s)")
+                        logger.debug("  - %s (age: %ss)", pdf.name, age)
                     self._run_organizer("pdf")
 
                 # Process media
                 if all_media:
-                    logger.info(f"Periodic scan: Found {len(all_media)} media file(s) across all folders, running organizer...")
+                    logger.info("Periodic scan: Found %s media file(s) across all folders, running organizer...", len(all_media))
                     for media in all_media[:5]:
                         age = int(current_time - media.stat().st_mtime)
-                        logger.debug(f"  - {media.name} (age: {age}s)")
+                        logger.debug("  - %s (age: %ss)", media.name, age)
                     self._run_organizer("media")
 
             except OSError as e:
-                logger.error(f"File system error in periodic scan: {e}")
+                logger.error("File system error in periodic scan: %s", e)
                 time.sleep(60)
             except Exception as e:
-                logger.error(f"Unexpected error in periodic scan: {e}")
+                logger.error("Unexpected error in periodic scan: %s", e)
                 time.sleep(60)
 
 